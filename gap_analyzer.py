@@ -15,6 +15,9 @@ Features
       3) {"A.5.1": true, "A.5.2": false, ...}
 - Emits machine-readable JSON + human-readable Markdown
 - Deterministic, CI-friendly exit codes
+- No required third-party deps; uses orjson for JSON I/O when installed
+- Inputs must be standard UTF-8 JSON: NaN/Infinity constants, a BOM or
+  another encoding are parse errors (exit 2)
 
 Exit codes
 0  success
@@ -25,41 +28,143 @@ Exit codes
 
 from __future__ import annotations
 import argparse
+import codecs
+import contextlib
 import json
+import mmap
 import sys
-import os
 import pathlib
-from datetime import datetime
-from typing import Dict, List, Tuple, Any, Set
+import pickle
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple, Any, IO
+
+# Optional speedup; stdlib json is used when orjson is not installed.
+# Known difference: orjson reads integers wider than 64 bits as floats
+# (e.g. 123456789012345678901234567890 -> 1.2345678901234568e+29), while
+# stdlib json keeps them exact.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # ---------------------------
 # I/O helpers
 # ---------------------------
 
-def _read_json(path: str) -> Any:
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print(f"❌ Error: File not found - {path}", file=sys.stderr)
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"❌ Error: Failed to parse JSON file {path}. Details: {e}", file=sys.stderr)
-        sys.exit(2)
+# Report files are written through a 64 KiB buffer to keep write() calls few.
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Report path meaning "write to stdout"
+_STDOUT_PATH = "-"
+
+def _reject_constant(name: str) -> Any:
+    # orjson only accepts standard JSON; keep the stdlib fallback consistent
+    raise json.JSONDecodeError(f"Non-standard JSON constant {name} is not allowed", name, 0)
+
+
+def _parse_file(path: str) -> Any:
+    """
+    Parse the JSON file at path. With orjson the file is memory-mapped and
+    parsed in place, skipping the copy into a bytes object.
+    """
+    if orjson is None:
+        # Decode explicitly: json.loads(bytes) would also guess UTF-16/32 and
+        # accept a BOM, which orjson (strict UTF-8) rejects
+        return json.loads(pathlib.Path(path).read_bytes().decode("utf-8"),
+                          parse_constant=_reject_constant)
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files and pipes cannot be mapped
+            return orjson.loads(f.read())
+        with mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj as UTF-8 JSON with 2-space indentation and a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _exit_on_read_errors(reads: List[Tuple[str, Future]]) -> None:
+    """
+    Map failed reads of (path, future) pairs onto the documented exit codes.
+    Any missing file (exit 1) is reported before any parse error (exit 2),
+    and within each kind the first path in reads wins.
+    """
+    errors = [(path, future.exception()) for path, future in reads]
+    for path, exc in errors:
+        if isinstance(exc, FileNotFoundError):
+            print(f"❌ Error: File not found - {path}", file=sys.stderr)
+            sys.exit(1)
+    for path, exc in errors:
+        if isinstance(exc, (json.JSONDecodeError, UnicodeDecodeError)):
+            print(f"❌ Error: Failed to parse JSON file {path}. Details: {exc}", file=sys.stderr)
+            sys.exit(2)
 
 
 def _ensure_parent_dir(path: str) -> None:
     pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
 
 
+@contextlib.contextmanager
+def _stdout_text() -> Iterator[IO[str]]:
+    """
+    Yield a UTF-8 text stream onto stdout and flush it on exit.
+    The bytes are encoded straight into sys.stdout.buffer by a codecs writer,
+    which does not own the buffer, so nothing needs detaching even if the
+    final flush fails (e.g. BrokenPipeError). A stdout without .buffer
+    (e.g. io.StringIO) is written to directly.
+    """
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    out = sys.stdout if buffer is None else codecs.getwriter("utf-8")(buffer)
+    try:
+        yield out
+    finally:
+        out.flush()
+
+
+@contextlib.contextmanager
+def _open_report(path: str) -> Iterator[IO[str]]:
+    """
+    Open a text report destination for writing. "-" streams to stdout (UTF-8);
+    anything else is a file path whose parent directories are created.
+    """
+    if path == _STDOUT_PATH:
+        with _stdout_text() as out:
+            yield out
+        return
+    _ensure_parent_dir(path)
+    with open(path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+        yield f
+
+
+def _write_report_bytes(path: str, data: bytes) -> None:
+    """Write UTF-8 encoded report data to path, or to stdout for "-"."""
+    if path == _STDOUT_PATH:
+        with _stdout_text() as out:
+            out.write(data.decode("utf-8"))
+        return
+    _ensure_parent_dir(path)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
 # ---------------------------
 # Flexible schema loaders
 # ---------------------------
 
 def _as_string_list(obj: Any) -> List[str]:
     """If obj is a list of strings, return it; else []"""
-    if isinstance(obj, list) and all(isinstance(x, str) for x in obj):
+    # One pass over element types in C instead of a per-item isinstance loop
+    if isinstance(obj, list) and set(map(type, obj)) <= {str}:
         return obj
     return []
 
@@ -67,31 +172,28 @@ def _as_controls_map(obj: Any) -> Dict[str, Dict[str, Any]]:
     """
     If obj looks like a map of control_id -> metadata dict, normalize to that.
     Values don't have to include 'title'; we keep whatever is present.
+    Metadata dicts are referenced as parsed, not copied.
     """
-    if isinstance(obj, dict):
+    if isinstance(obj, dict) and obj:
         # Heuristic: keys look like ISO control IDs; values dict-like or str
         # We'll coerce str values into {"title": str}
-        out: Dict[str, Dict[str, Any]] = {}
-        for k, v in obj.items():
-            if isinstance(v, dict):
-                out[k] = dict(v)
-            elif isinstance(v, str):
-                out[k] = {"title": v}
-            elif isinstance(v, bool):
-                # This might be an implementation map; don't treat as controls map.
-                return {}
-            else:
-                # Unknown shape; skip
-                return {}
-        if out:
-            return out
+        vtypes = set(map(type, obj.values()))
+        if vtypes <= {dict}:
+            return obj
+        if vtypes <= {dict, str}:
+            return {k: (v if type(v) is dict else {"title": v}) for k, v in obj.items()}
+        # bool values suggest an implementation map; anything else is an unknown shape
     return {}
 
+def _interned(ids: List[str]) -> List[str]:
+    """Intern control IDs so lookups across both input files hit on identity."""
+    return list(map(sys.intern, ids))
+
 def load_controls(controls_json: Any) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
     """
     Returns:
       controls_map: {control_id: {"title": "...", ...}}
-      controls_ids: list of control IDs (order not guaranteed)
+      controls_ids: sorted list of control IDs
     Accepts:
       - {"controls": ["A.5.1", ...]}
       - ["A.5.1", ...]
@@ -99,28 +201,29 @@ def load_controls(controls_json: Any) -> Tuple[Dict[str, Dict[str, Any]], List[s
     """
     # Case 1: root has "controls": [ids]
     if isinstance(controls_json, dict) and "controls" in controls_json:
-        ids = _as_string_list(controls_json.get("controls"))
+        ids = _interned(_as_string_list(controls_json.get("controls")))
         if ids:
-            return ({cid: {} for cid in ids}, ids)
+            return ({cid: {} for cid in ids}, sorted(ids))
 
     # Case 2: root is list of ids
-    ids = _as_string_list(controls_json)
+    ids = _interned(_as_string_list(controls_json))
     if ids:
-        return ({cid: {} for cid in ids}, ids)
+        return ({cid: {} for cid in ids}, sorted(ids))
 
     # Case 3: map of id -> metadata
     cmap = _as_controls_map(controls_json)
     if cmap:
-        return (cmap, list(cmap.keys()))
+        cmap = {sys.intern(k): v for k, v in cmap.items()}
+        return (cmap, sorted(cmap))
 
     print("❌ Error: Controls file must be either a list of IDs, "
           "an object with 'controls': [IDs], or a map of ID->metadata.", file=sys.stderr)
     sys.exit(3)
 
-def load_implemented(impl_json: Any) -> Tuple[Set[str], Dict[str, bool]]:
+def load_implemented(impl_json: Any) -> Tuple[FrozenSet[str], Dict[str, bool]]:
     """
     Returns:
-      implemented_ids: set of implemented control IDs (best-effort)
+      implemented_ids: frozenset of implemented control IDs (best-effort)
       implemented_map: explicit map id->bool if available; else inferred True for listed IDs
     Accepts:
       - {"controls": ["A.5.1", ...]}
@@ -129,14 +232,14 @@ def load_implemented(impl_json: Any) -> Tuple[Set[str], Dict[str, bool]]:
     """
     # Case 1: {"controls": [ids]}
     if isinstance(impl_json, dict) and "controls" in impl_json:
-        ids = _as_string_list(impl_json.get("controls"))
+        ids = _interned(_as_string_list(impl_json.get("controls")))
         if ids:
-            return (set(ids), {cid: True for cid in ids})
+            return (frozenset(ids), {cid: True for cid in ids})
 
     # Case 2: [ids]
-    ids = _as_string_list(impl_json)
+    ids = _interned(_as_string_list(impl_json))
     if ids:
-        return (set(ids), {cid: True for cid in ids})
+        return (frozenset(ids), {cid: True for cid in ids})
 
     # Case 3: map id->bool
     if isinstance(impl_json, dict):
@@ -144,105 +247,175 @@ def load_implemented(impl_json: Any) -> Tuple[Set[str], Dict[str, bool]]:
         clean_map: Dict[str, bool] = {}
         for k, v in impl_json.items():
             if isinstance(v, bool):
-                clean_map[k] = v
+                clean_map[sys.intern(k)] = v
             else:
                 print(f"⚠️  Warning: Implementation value for {k} is not boolean; ignoring.", file=sys.stderr)
         if clean_map:
-            implemented_ids = {k for k, flag in clean_map.items() if flag}
+            implemented_ids = frozenset(k for k, flag in clean_map.items() if flag)
             return (implemented_ids, clean_map)
 
     print("❌ Error: Implementation file must be either a list of IDs, "
           "an object with 'controls': [IDs], or a map of ID->bool.", file=sys.stderr)
     sys.exit(3)
 
+# Controls cache key: (resolved path, size, mtime_ns) of the controls file
+_CacheKey = Tuple[str, int, int]
+
+def _controls_cache_key(path: str) -> Optional[_CacheKey]:
+    try:
+        st = pathlib.Path(path).stat()
+    except OSError:
+        # The read itself reports the problem with its usual exit code
+        return None
+    return (str(pathlib.Path(path).resolve()), st.st_size, st.st_mtime_ns)
+
+def _load_controls_cache(cache_path: str, key: _CacheKey
+                         ) -> Optional[Tuple[Dict[str, Dict[str, Any]], List[str]]]:
+    """
+    Return the cached (controls_map, controls_ids) if it matches key; else None.
+    The cached map keeps only each control's title.
+    """
+    try:
+        cached_key, controls_map, controls_ids = pickle.loads(pathlib.Path(cache_path).read_bytes())
+    except Exception:
+        # Best-effort: a missing or unreadable cache just means a normal parse
+        return None
+    if cached_key != key:
+        return None
+    # Unpickled strings are not interned; restore that for lookups
+    return ({sys.intern(k): v for k, v in controls_map.items()}, _interned(controls_ids))
+
+def _write_controls_cache(cache_path: str, key: _CacheKey,
+                          controls_map: Dict[str, Dict[str, Any]], controls_ids: List[str]) -> None:
+    # Only titles are ever read from the metadata; dropping the rest keeps the
+    # pickle (and the cache-hit load) small
+    no_meta: Dict[str, Any] = {}
+    titles_only = {cid: ({"title": meta["title"]} if "title" in meta else no_meta)
+                   for cid, meta in controls_map.items()}
+    try:
+        _ensure_parent_dir(cache_path)
+        pathlib.Path(cache_path).write_bytes(
+            pickle.dumps((key, titles_only, controls_ids), protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError as e:
+        print(f"⚠️  Warning: Could not write controls cache {cache_path}: {e}", file=sys.stderr)
+
+def _read_controls(path: str, cache_path: Optional[str] = None
+                   ) -> Tuple[Optional[_CacheKey],
+                              Optional[Tuple[Dict[str, Dict[str, Any]], List[str]]],
+                              Any]:
+    """
+    Read the controls file, or its cached normalized form, without validating it.
+    Returns (cache_key, cached, controls_json):
+      cache_key: key to store a fresh result under, or None when not caching
+      cached: (controls_map, controls_ids) on a cache hit, else None
+      controls_json: parsed document on a cache miss, else None
+    Normalization (load_controls) is left to the caller so exit codes keep
+    their usual precedence.
+    """
+    key = _controls_cache_key(path) if cache_path is not None else None
+    if key is not None:
+        cached = _load_controls_cache(cache_path, key)
+        if cached is not None:
+            return key, cached, None
+    return key, None, _parse_file(path)
+
 
 # ---------------------------
 # Core logic
 # ---------------------------
 
+@dataclass
+class GapResults:
+    """
+    Per-control results stored as parallel lists (struct-of-arrays):
+    index i of ids, titles and implemented describes the same control.
+    """
+    ids: List[str]
+    titles: List[str]
+    implemented: List[bool]
+
+    def as_rows(self) -> List[Dict[str, Any]]:
+        """Build the list of {id, title, implemented} dicts used by the JSON report."""
+        return [{"id": cid, "title": title, "implemented": implemented}
+                for cid, title, implemented in zip(self.ids, self.titles, self.implemented)]
+
 def compute_gaps(
     controls_map: Dict[str, Dict[str, Any]],
     controls_ids: List[str],
-    implemented_ids: Set[str],
-    implemented_map: Dict[str, bool],
-) -> Tuple[List[Dict[str, Any]], Dict[str, Any], List[str]]:
+    implemented_ids: FrozenSet[str],
+) -> Tuple[GapResults, Dict[str, Any], List[str]]:
     """
+    controls_ids must already be sorted (as returned by load_controls);
+    results and gaps follow its order.
+
     Returns:
-      results: list of {id, title, implemented}
+      results: GapResults over controls_ids (ids is controls_ids itself)
       summary: {total_controls, implemented, gaps}
       gaps: list of missing control IDs
     """
-    results: List[Dict[str, Any]] = []
-    gaps: List[str] = []
-
-    for cid in sorted(controls_ids):
-        meta = controls_map.get(cid, {})
-        title = meta.get("title", "")
-        implemented = implemented_map.get(cid, (cid in implemented_ids))
-        implemented = bool(implemented)
-
-        results.append({
-            "id": cid,
-            "title": title,
-            "implemented": implemented
-        })
-        if not implemented:
-            gaps.append(cid)
+    # Column-wise comprehensions: each is a tight loop with no per-item
+    # append calls or branching, which beats one general-purpose loop.
+    cmap_get = controls_map.get
+    no_meta: Dict[str, Any] = {}
+    titles = [cmap_get(cid, no_meta).get("title", "") for cid in controls_ids]
+    flags = [cid in implemented_ids for cid in controls_ids]
+    gaps = [cid for cid, implemented in zip(controls_ids, flags) if not implemented]
 
     summary = {
         "total_controls": len(controls_ids),
-        "implemented": sum(1 for r in results if r["implemented"]),
+        "implemented": len(controls_ids) - len(gaps),
         "gaps": len(gaps),
     }
-    return results, summary, gaps
+    return GapResults(controls_ids, titles, flags), summary, gaps
 
 
 # ---------------------------
 # Renderers
 # ---------------------------
 
+_MD_ROW = "| %s | %s | %s |\n"
+_TICK = "✅"
+_CROSS = "❌"
+
 def write_json_report(path: str, meta: Dict[str, Any], summary: Dict[str, Any],
-                      results: List[Dict[str, Any]], gaps: List[str]) -> None:
-    _ensure_parent_dir(path)
+                      results: GapResults, gaps: List[str]) -> None:
     payload = {
         "meta": meta,
         "summary": summary,
-        "results": results,
+        "results": results.as_rows(),
         "gaps": gaps
     }
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=False)
+    _write_report_bytes(path, _dumps(payload))
 
 def write_markdown_report(path: str, meta: Dict[str, Any], summary: Dict[str, Any],
-                          results: List[Dict[str, Any]], gaps: List[str]) -> None:
-    _ensure_parent_dir(path)
-    lines: List[str] = []
-    lines.append("# ISO 27001 Gap Report")
-    lines.append("")
-    lines.append(f"- Generated: `{meta['generated_at']}`")
-    lines.append(f"- Controls file: `{meta['controls']}`")
-    lines.append(f"- Implementation file: `{meta['implementation']}`")
-    lines.append("")
-    lines.append(f"**Summary**: {summary['implemented']}/{summary['total_controls']} implemented, {summary['gaps']} gaps.")
-    lines.append("")
-    if gaps:
-        lines.append("## Gaps")
-        for cid in gaps:
-            title = next((r["title"] for r in results if r["id"] == cid), "")
-            if title:
-                lines.append(f"- **{cid}** — {title}")
-            else:
-                lines.append(f"- **{cid}**")
-        lines.append("")
-    lines.append("## Full Results")
-    lines.append("")
-    lines.append("| Control ID | Title | Implemented |")
-    lines.append("|---|---|---|")
-    for r in results:
-        lines.append(f"| {r['id']} | {r['title']} | {'✅' if r['implemented'] else '❌'} |")
-
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+                          results: GapResults, gaps: List[str]) -> None:
+    # Rows go straight to the buffered file; no intermediate list or join
+    with _open_report(path) as f:
+        write = f.write
+        write("# ISO 27001 Gap Report\n")
+        write("\n")
+        write(f"- Generated: `{meta['generated_at']}`\n")
+        write(f"- Controls file: `{meta['controls']}`\n")
+        write(f"- Implementation file: `{meta['implementation']}`\n")
+        write("\n")
+        write(f"**Summary**: {summary['implemented']}/{summary['total_controls']} implemented, {summary['gaps']} gaps.\n")
+        write("\n")
+        if gaps:
+            titles_by_id = dict(zip(results.ids, results.titles))
+            write("## Gaps\n")
+            for cid in gaps:
+                title = titles_by_id.get(cid, "")
+                if title:
+                    write(f"- **{cid}** — {title}\n")
+                else:
+                    write(f"- **{cid}**\n")
+            write("\n")
+        write("## Full Results\n")
+        write("\n")
+        write("| Control ID | Title | Implemented |\n")
+        write("|---|---|---|\n")
+        for cid, title, implemented in zip(results.ids, results.titles, results.implemented):
+            write(_MD_ROW % (cid, title, _TICK if implemented else _CROSS))
 
 
 # ---------------------------
@@ -255,17 +428,28 @@ def build_argparser() -> argparse.ArgumentParser:
                     required=False,
                     default="iso_27001_controls.json",
                     help="Path to ISO controls JSON (list, map, or object with 'controls').")
+    ap.add_argument("--controls-cache",
+                    required=False,
+                    default=None,
+                    help="Optional path for a pickle cache of the parsed controls file, "
+                         "reused while the controls file is unchanged. Only use a trusted location.")
     ap.add_argument("--implementation",
                     required=True,
                     help="Path to implemented controls JSON (list, map id->bool, or object with 'controls').")
     ap.add_argument("--out-json",
                     required=False,
                     default="reports/gap_report.json",
-                    help="Path to write machine-readable JSON report.")
+                    help="Path to write machine-readable JSON report ('-' for stdout).")
     ap.add_argument("--out-md",
                     required=False,
                     default="reports/gap_report.md",
-                    help="Path to write Markdown report.")
+                    help="Path to write Markdown report ('-' for stdout).")
+    ap.add_argument("--skip-json",
+                    action="store_true",
+                    help="Do not write the JSON report.")
+    ap.add_argument("--skip-md",
+                    action="store_true",
+                    help="Do not write the Markdown report.")
     return ap
 
 
@@ -273,18 +457,40 @@ def main() -> None:
     ap = build_argparser()
     args = ap.parse_args()
 
-    # Validate input paths early
-    for p in [args.controls, args.implementation]:
-        if not os.path.exists(p):
-            print(f"❌ Error: {p} not found", file=sys.stderr)
-            sys.exit(1)
+    # Two reports concatenated on stdout could not be parsed as either format
+    if (not args.skip_json and not args.skip_md
+            and args.out_json == _STDOUT_PATH and args.out_md == _STDOUT_PATH):
+        print("❌ Error: --out-json and --out-md cannot both be '-'; "
+              "use --skip-json or --skip-md to stream a single report.", file=sys.stderr)
+        sys.exit(1)
 
-    # Load JSON
-    controls_json = _read_json(args.controls)
-    impl_json = _read_json(args.implementation)
+    # The cache is overwritten on a miss; never let that clobber an input
+    if args.controls_cache is not None:
+        cache_target = pathlib.Path(args.controls_cache).resolve()
+        if cache_target in (pathlib.Path(args.controls).resolve(),
+                            pathlib.Path(args.implementation).resolve()):
+            print(f"❌ Error: --controls-cache {args.controls_cache} is one of the input files.",
+                  file=sys.stderr)
+            sys.exit(1)
 
-    # Normalize schemas
-    controls_map, controls_ids = load_controls(controls_json)
+    # Load JSON. Both files are read and parsed concurrently to overlap disk
+    # latency. Workers only raise; once both are done, errors are reported in
+    # a fixed order (missing files first, controls file first) so stderr and
+    # exit codes stay deterministic.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        controls_future = ex.submit(_read_controls, args.controls, args.controls_cache)
+        impl_future = ex.submit(_parse_file, args.implementation)
+    _exit_on_read_errors([(args.controls, controls_future), (args.implementation, impl_future)])
+    cache_key, cached_controls, controls_json = controls_future.result()
+    impl_json = impl_future.result()
+
+    # Normalize schemas (only after both files were read, so read errors win)
+    if cached_controls is not None:
+        controls_map, controls_ids = cached_controls
+    else:
+        controls_map, controls_ids = load_controls(controls_json)
+        if cache_key is not None:
+            _write_controls_cache(args.controls_cache, cache_key, controls_map, controls_ids)
     implemented_ids, implemented_map = load_implemented(impl_json)
 
     # Validate
@@ -293,38 +499,47 @@ def main() -> None:
         sys.exit(3)
 
     # Warn about unknown IDs in implementation
-    unknown_impl = sorted(list((set(implemented_map.keys()) | implemented_ids) - set(controls_ids)))
+    # (implemented_map covers every ID in implemented_ids; controls_map keys are controls_ids)
+    unknown_impl = implemented_map.keys() - controls_map.keys()
     if unknown_impl:
-        print(f"⚠️  Warning: Implementation contains IDs not present in controls: {unknown_impl}", file=sys.stderr)
+        print(f"⚠️  Warning: Implementation contains IDs not present in controls: {sorted(unknown_impl)}", file=sys.stderr)
 
     # Compute results
-    results, summary, gaps = compute_gaps(controls_map, controls_ids, implemented_ids, implemented_map)
+    results, summary, gaps = compute_gaps(controls_map, controls_ids, implemented_ids)
 
     # Meta + outputs
     meta = {
-        "generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "controls": args.controls,
         "implementation": args.implementation,
         "tool": "iso27001-gap-analyzer",
         "version": "1.1.0"
     }
 
-    write_json_report(args.out_json, meta, summary, results, gaps)
-    write_markdown_report(args.out_md, meta, summary, results, gaps)
-
-    # Console summary (nice for CI logs)
-    print("\n📊 ISO 27001 Gap Analysis Report")
-    print("=" * 40)
-    print(f"Total Required Controls: {summary['total_controls']}")
-    print(f"Controls Implemented:   {summary['implemented']}")
-    print(f"Controls Missing:       {summary['gaps']}")
+    written: List[str] = []
+    if not args.skip_json:
+        write_json_report(args.out_json, meta, summary, results, gaps)
+        written.append(args.out_json)
+    if not args.skip_md:
+        write_markdown_report(args.out_md, meta, summary, results, gaps)
+        written.append(args.out_md)
+
+    # Console summary (nice for CI logs); moved to stderr when a report owns stdout
+    console = sys.stderr if _STDOUT_PATH in written else sys.stdout
+    print("\n📊 ISO 27001 Gap Analysis Report", file=console)
+    print("=" * 40, file=console)
+    print(f"Total Required Controls: {summary['total_controls']}", file=console)
+    print(f"Controls Implemented:   {summary['implemented']}", file=console)
+    print(f"Controls Missing:       {summary['gaps']}", file=console)
     if gaps:
-        print("-" * 40)
-        print("❗ Missing Controls (IDs):")
+        print("-" * 40, file=console)
+        print("❗ Missing Controls (IDs):", file=console)
         for cid in gaps:
-            print(f"   - {cid}")
-    print("=" * 40)
-    print(f"Reports written:\n - {args.out_json}\n - {args.out_md}")
+            print(f"   - {cid}", file=console)
+    print("=" * 40, file=console)
+    if written:
+        shown = ["<stdout>" if p == _STDOUT_PATH else p for p in written]
+        print("Reports written:\n" + "\n".join(f" - {p}" for p in shown), file=console)
 
     # Successful termination even when gaps exist (gaps are expected)
     sys.exit(0)